@@ -19,6 +19,12 @@ Usage:
        --include "/docs/,/v1/"  (comma-separated substrings that must appear in the URL)
        --exclude "/blog/,?ref="  (comma-separated substrings to skip)
 
+  4) (Optional) Tune rendering:
+       --wait networkidle  (slow-but-safe page-load wait for late-rendering sites)
+       --keep-images       (load images; blocked by default for speed)
+       --browsers 4        (Chromium instances to pool; 0 = auto from CPU count)
+       --procs 4           (worker processes for rendering on many-core hosts)
+
 Notes:
  - Respects robots.txt (disallows are skipped).
  - Applies polite rate limiting.
@@ -28,62 +34,159 @@ Notes:
 
 import argparse
 import asyncio
+import functools
+import os
 import re
 import sys
+import threading
 import time
 import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.robotparser import RobotFileParser
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 from pypdf import PdfReader, PdfWriter
+from selectolax.parser import HTMLParser
+
+try:
+    import pikepdf
+except ImportError:  # pragma: no cover - fall back to the pure-Python merge
+    pikepdf = None
 
 DEFAULT_HEADERS = {"User-Agent": "doc2pdf/1.0 (+https://github.com/)"}
 
+# Google documents that robots.txt is truncated at 500 KB; do the same.
+ROBOTS_MAX_BYTES = 500 * 1024
+
+# Minimum spacing between two fetches to the same host (seconds).
+POLITE_DELAY = 0.3
+
+# Resource types and tracker hosts that are irrelevant for printing a
+# documentation page to PDF; blocked during rendering unless kept by flag.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_URL_PARTS = ("google-analytics", "googletagmanager", "gtag/js", "hotjar")
+
+# A single Chromium process degrades above this many concurrent tabs.
+MAX_TABS_PER_BROWSER = 25
+
+# Characters squashed to "_" when deriving a PDF filename from a URL path.
+_SAFE_RE = re.compile(r"[^A-Za-z0-9]+")
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> httpx.Client:
+    """Return the shared HTTP client, created on first use.
+
+    One client serves robots.txt, sitemap, and crawl fetches so TCP/TLS
+    connections (and HTTP/2 streams) are reused across phases instead of
+    being torn down between them.
+
+    Returns:
+        A pooled httpx.Client with HTTP/2 enabled.
+    """
+    return httpx.Client(
+        http2=True, headers=DEFAULT_HEADERS, limits=HTTP_LIMITS, timeout=15
+    )
+
 
-def load_robots(base_url: str) -> RobotFileParser:
-    """Fetch and parse robots.txt for the given base URL.
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, created on first use.
+
+    Async counterpart of :func:`get_client`, used by the concurrent
+    crawler so overlapping fetches share one connection pool.
+
+    Returns:
+        A pooled httpx.AsyncClient with HTTP/2 enabled.
+    """
+    return httpx.AsyncClient(
+        http2=True, headers=DEFAULT_HEADERS, limits=HTTP_LIMITS, timeout=15
+    )
+
+
+# Serializes concurrent first-time lookups per origin: lru_cache does not
+# lock around the wrapped call, so without this, several crawl workers
+# missing the cache at once would each fetch the same robots.txt.
+_robots_locks: Dict[str, threading.Lock] = {}
+
+
+def get_robots(scheme_netloc: str) -> RobotFileParser:
+    """Fetch, parse, and cache robots.txt for an origin.
+
+    Each origin is fetched at most once per process; repeated lookups
+    reuse the parsed rules. Only the first 500 KB of the file is read.
 
     Args:
-        base_url: The root URL of the site.
+        scheme_netloc: Origin in the form "scheme://netloc".
 
     Returns:
         A RobotFileParser object with rules from robots.txt.
     """
-    parsed = urllib.parse.urlparse(base_url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+    lock = _robots_locks.setdefault(scheme_netloc, threading.Lock())
+    with lock:
+        return _fetch_robots(scheme_netloc)
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_robots(scheme_netloc: str) -> RobotFileParser:
+    """Do the actual robots.txt download and parse for get_robots."""
     rp = RobotFileParser()
+    body = b""
     try:
-        with httpx.Client(headers=DEFAULT_HEADERS, timeout=10) as client:
-            r = client.get(robots_url)
+        with get_client().stream(
+            "GET", f"{scheme_netloc}/robots.txt", timeout=10
+        ) as r:
             if r.status_code == 200:
-                rp.parse(r.text.splitlines())
-            else:
-                rp.parse([])
+                for chunk in r.iter_bytes():
+                    body += chunk
+                    if len(body) >= ROBOTS_MAX_BYTES:
+                        break
+        rp.parse(body[:ROBOTS_MAX_BYTES].decode("utf-8", "ignore").splitlines())
     except httpx.HTTPError:
         rp.parse([])
     return rp
 
 
-def allowed_by_robots(rp: RobotFileParser, url: str) -> bool:
-    """Check if the URL is allowed by robots.txt.
+def allowed_by_robots(url: str) -> bool:
+    """Check if the URL is allowed by its origin's robots.txt.
 
     Args:
-        rp: Parsed RobotFileParser.
         url: URL to check.
 
     Returns:
         True if allowed, False otherwise.
     """
+    parsed = urllib.parse.urlparse(url)
+    rp = get_robots(f"{parsed.scheme}://{parsed.netloc}")
     try:
         return rp.can_fetch(DEFAULT_HEADERS["User-Agent"], url)
     except httpx.HTTPError:
         return True
 
 
+def _url_fp(url: str) -> int:
+    """Fingerprint a URL for frontier membership checks.
+
+    Built-in str hashing is SipHash salted per process, so collisions
+    cannot be manufactured across runs; storing the int instead of the
+    full URL cuts per-entry memory roughly 10x on large crawls.
+
+    Args:
+        url: URL to fingerprint.
+
+    Returns:
+        Process-stable integer fingerprint.
+    """
+    return hash(url)
+
+
 def normalize_url(url: str) -> str:
     """Normalize a URL by removing fragments.
 
@@ -113,113 +216,230 @@ def same_domain(a: str, b: str) -> bool:
     return pa.scheme == pb.scheme and pa.netloc == pb.netloc
 
 
-def match_filters(url: str, includes: List[str], excludes: List[str]) -> bool:
-    """Check if URL matches include/exclude filters.
+def compile_filters(
+    includes: List[str], excludes: List[str]
+) -> Tuple[Optional[re.Pattern], Optional[re.Pattern]]:
+    """Compile include/exclude substring lists into alternation regexes.
+
+    One compiled alternation scans the URL in a single pass, instead of
+    one `in` scan per substring per link.
+
+    Args:
+        includes: Substrings URLs must contain (empty = no constraint).
+        excludes: Substrings URLs must not contain (empty = no constraint).
+
+    Returns:
+        (include_pattern, exclude_pattern), either of which may be None.
+    """
+    inc_re = re.compile("|".join(map(re.escape, includes))) if includes else None
+    exc_re = re.compile("|".join(map(re.escape, excludes))) if excludes else None
+    return inc_re, exc_re
+
+
+def match_filters(
+    url: str, inc_re: Optional[re.Pattern], exc_re: Optional[re.Pattern]
+) -> bool:
+    """Check if URL matches compiled include/exclude filters.
 
     Args:
         url: Target URL.
-        includes: List of substrings that must be present.
-        excludes: List of substrings that must NOT be present.
+        inc_re: Compiled include alternation, or None for no constraint.
+        exc_re: Compiled exclude alternation, or None for no constraint.
 
     Returns:
         True if URL matches filters.
     """
-    if includes and not any(s in url for s in includes):
+    if inc_re is not None and inc_re.search(url) is None:
         return False
-    if excludes and any(s in url for s in excludes):
+    if exc_re is not None and exc_re.search(url) is not None:
         return False
     return True
 
 
-def extract_links(html: str, base_url: str) -> List[str]:
+def extract_links(html: bytes, base_url: str) -> List[str]:
     """Extract absolute links from HTML content.
 
     Args:
-        html: HTML source.
+        html: Raw HTML bytes; the parser sniffs the encoding itself,
+            which is cheaper than decoding to str up front.
         base_url: Base URL for resolving relative links.
 
     Returns:
         List of absolute URLs found in the page.
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = HTMLParser(html)
     return [
-        urllib.parse.urljoin(base_url, a["href"]) for a in soup.find_all("a", href=True)
+        urllib.parse.urljoin(base_url, href)
+        for node in tree.css("a[href]")
+        if (href := node.attributes.get("href"))
     ]
 
 
-def retrieve_from_sitemap(sitemap_url: str) -> List[str]:
-    """Extract URLs from sitemap.xml.
+async def retrieve_from_sitemap(
+    sitemap_url: str, seen: Optional[Set[str]] = None
+) -> List[str]:
+    """Extract URLs from sitemap.xml, following nested sitemap indexes.
+
+    The response is parsed incrementally chunk-by-chunk, so large sitemaps
+    never have to fit in memory as a single string. Nested sitemaps from
+    an index file are fetched concurrently, so an index with N children
+    costs roughly one round-trip instead of N.
 
     Args:
-        sitemap_url: URL of the sitemap.
+        sitemap_url: URL of the sitemap (or sitemap index).
+        seen: Sitemap URLs already fetched in this recursion; guards
+            against index files that reference themselves or each other.
 
     Returns:
-        List of URLs found in <loc> tags.
+        Deduplicated list of page URLs found in <url><loc> tags, including
+        those from any nested sitemaps listed in <sitemap><loc> entries.
     """
-    urls = []
+    if seen is None:
+        seen = set()
+    seen.add(sitemap_url)
+    urls: List[str] = []
+    nested: List[str] = []
     try:
-        with httpx.Client(headers=DEFAULT_HEADERS, timeout=20) as client:
-            r = client.get(sitemap_url)
+        async with get_async_client().stream("GET", sitemap_url, timeout=20) as r:
             r.raise_for_status()
-            text = r.text
-        for m in re.finditer(r"<loc>(.*?)</loc>", text):
-            urls.append(m.group(1).strip())
-    except (httpx.HTTPError, httpx.TimeoutException, httpx.RequestError, re.error) as e:
+            parser = etree.XMLPullParser(
+                events=("end",), tag=("{*}url", "{*}sitemap")
+            )
+            async for chunk in r.aiter_bytes():
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    loc = (elem.findtext("{*}loc") or "").strip()
+                    if loc:
+                        if etree.QName(elem).localname == "sitemap":
+                            nested.append(loc)
+                        else:
+                            urls.append(loc)
+                    # Free the parsed subtree so memory stays flat.
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            parser.close()
+    except (httpx.HTTPError, etree.XMLSyntaxError) as e:
         print(f"[warn] Failed to read sitemap {sitemap_url}: {e}", file=sys.stderr)
+    # Mark children as seen before fanning out so sibling branches can't
+    # schedule the same sitemap twice.
+    new = [child for child in nested if child not in seen]
+    seen.update(new)
+    if new:
+        children = await asyncio.gather(
+            *(retrieve_from_sitemap(child, seen) for child in new)
+        )
+        return list(set(urls).union(*children))
     return urls
 
 
-def crawl(
-    start_url: str, includes: List[str], excludes: List[str], max_pages: int
+async def crawl_async(
+    start_url: str,
+    includes: List[str],
+    excludes: List[str],
+    max_pages: int,
+    concurrency: int = 10,
 ) -> List[str]:
-    """Breadth-first crawl of a site to collect URLs.
+    """Breadth-first crawl of a site to collect URLs, with concurrent fetches.
+
+    Up to ``concurrency`` pages are fetched in parallel; the polite delay
+    is enforced per host, so same-host requests stay spaced out while
+    fetches to different hosts overlap freely.
 
     Args:
         start_url: Root URL to start crawling.
         includes: Substrings to keep URLs.
         excludes: Substrings to filter out.
         max_pages: Max number of pages to crawl.
+        concurrency: Max parallel fetch workers.
 
     Returns:
         List of collected URLs.
     """
-    visited: Set[str] = set()
-    queue: List[str] = [start_url]
+    start = normalize_url(start_url)
+    inc_re, exc_re = compile_filters(includes, excludes)
+    queue: asyncio.Queue = asyncio.Queue()
+    queue.put_nowait(start)
+    # Fingerprints, not full URLs: the frontier set only answers
+    # membership, and the collected URLs live in `out`.
+    queued: Set[int] = {_url_fp(start)}
     out: List[str] = []
-    rp = load_robots(start_url)
-    with httpx.Client(headers=DEFAULT_HEADERS, timeout=15) as client:
-        while queue and len(out) < max_pages:
-            url = normalize_url(queue.pop(0))
-            if url in visited:
-                continue
-            visited.add(url)
-
-            if not same_domain(start_url, url):
-                continue
-            if not match_filters(url, includes, excludes):
-                continue
-            if not allowed_by_robots(rp, url):
-                print(f"[skip robots] {url}")
-                continue
-
+    next_ok: Dict[str, float] = {}
+    host_locks: Dict[str, asyncio.Lock] = {}
+    client = get_async_client()
+
+    async def _polite_wait(url: str):
+        # Reserve the next fetch slot for this host, then sleep until it.
+        # Hosts that publish a robots.txt Crawl-delay get that spacing;
+        # everyone else gets the default. The parser comes from the
+        # lru_cache and was already fetched by the robots check above.
+        parsed = urllib.parse.urlparse(url)
+        netloc = parsed.netloc
+        rp = get_robots(f"{parsed.scheme}://{netloc}")
+        delay = float(rp.crawl_delay(DEFAULT_HEADERS["User-Agent"]) or POLITE_DELAY)
+        async with host_locks.setdefault(netloc, asyncio.Lock()):
+            now = time.monotonic()
+            ready = max(now, next_ok.get(netloc, now))
+            next_ok[netloc] = ready + delay
+        wait = ready - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def worker():
+        while True:
+            url = await queue.get()
             try:
-                r = client.get(url)
-                if r.status_code >= 400:
+                if len(out) >= max_pages:
+                    continue
+                if not same_domain(start_url, url):
+                    continue
+                if not match_filters(url, inc_re, exc_re):
+                    continue
+                if not await asyncio.to_thread(allowed_by_robots, url):
+                    print(f"[skip robots] {url}")
+                    continue
+
+                await _polite_wait(url)
+                r = await client.get(
+                    url, headers={"Accept": "text/html,*/*;q=0.1"}
+                )
+                if r.status_code >= 400 or len(out) >= max_pages:
                     continue
                 out.append(url)
-                links = extract_links(r.text, url)
-                for link in links:
+                # Don't feed PDFs, images, or JSON to the HTML parser.
+                if "html" not in r.headers.get("content-type", ""):
+                    continue
+                for link in extract_links(r.content, url):
                     nl = normalize_url(link)
-                    if nl not in visited and same_domain(start_url, nl):
-                        if match_filters(nl, includes, excludes):
-                            queue.append(nl)
-                time.sleep(0.3)  # polite delay
-            except (httpx.HTTPError, httpx.TimeoutException, httpx.RequestError) as e:
-                print(f"[warn] fetch error for {url}: {e}", file=sys.stderr)
+                    fp = _url_fp(nl)
+                    if fp not in queued and same_domain(start_url, nl):
+                        if match_filters(nl, inc_re, exc_re):
+                            queued.add(fp)
+                            queue.put_nowait(nl)
+            except Exception as e:
+                # Deliberately broad: besides httpx errors this body can
+                # raise e.g. ValueError from urlparse/urljoin on malformed
+                # hrefs, and an escaping exception would kill the worker
+                # task and leave queue.join() waiting forever.
+                print(f"[warn] crawl error for {url}: {e}", file=sys.stderr)
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    await queue.join()
+    for w in workers:
+        w.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
     return out
 
 async def render_to_pdf(
-    urls: List[str], out_dir: Path, concurrency: int = 4, timeout: int = 45
+    urls: List[str],
+    out_dir: Path,
+    concurrency: int = 4,
+    timeout: int = 45,
+    keep_images: bool = False,
+    wait: str = "domcontentloaded",
+    browsers: int = 0,
 ) -> List[Tuple[str, Path]]:
     """Render multiple URLs to individual PDF files.
 
@@ -228,75 +448,247 @@ async def render_to_pdf(
         out_dir: Directory to store individual PDFs.
         concurrency: Max parallel rendering tasks.
         timeout: Page load timeout (seconds).
+        keep_images: Load images too (e.g. for docs with screenshots).
+        wait: page.goto wait condition; "networkidle" is the slow-but-safe
+            fallback for sites that render late.
+        browsers: Chromium instances to pool; 0 picks a size from CPU
+            count and concurrency.
 
     Returns:
         List of (url, pdf_path) pairs in order.
     """
     out_dir.mkdir(parents=True, exist_ok=True)
+    # Plain string paths inside the loop; Path arithmetic happens once here.
+    out_str = str(out_dir)
+    blocked_types = BLOCKED_RESOURCE_TYPES - ({"image"} if keep_images else set())
+
+    async def block_nonessential(route):
+        if route.request.resource_type in blocked_types or any(
+            part in route.request.url for part in BLOCKED_URL_PARTS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    if browsers < 1:
+        browsers = max(1, min(concurrency, (os.cpu_count() or 2) // 2))
+    # Enough processes that no browser exceeds its healthy tab count.
+    browsers = max(browsers, -(-concurrency // MAX_TABS_PER_BROWSER))
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch()
+        pool = [await p.chromium.launch() for _ in range(browsers)]
+        # One shared context per browser: creating a context per URL costs
+        # tens to hundreds of ms; a page (tab) is much cheaper.
+        contexts = []
+        for browser in pool:
+            context = await browser.new_context()
+            context.set_default_navigation_timeout(timeout * 1000)
+            await context.route("**/*", block_nonessential)
+            contexts.append(context)
+        active_tabs = [0] * browsers
         sem = asyncio.Semaphore(concurrency)
         results: List[Tuple[str, Path]] = []
 
         async def worker(u: str):
             async with sem:
+                # Route to the least-loaded browser in the pool.
+                i = min(range(browsers), key=active_tabs.__getitem__)
+                active_tabs[i] += 1
                 try:
-                    context = await browser.new_context()
-                    page = await context.new_page()
-                    await page.goto(u, wait_until="networkidle", timeout=timeout * 1000)
-                    await page.emulate_media(media="print")
-                    safe = re.sub(
-                        r"[^A-Za-z0-9]+",
-                        "_",
-                        urllib.parse.urlparse(u).path.strip("/") or "index",
-                    )[:100]
-                    pdf_path = out_dir / f"{safe}.pdf"
-                    await page.pdf(
-                        path=str(pdf_path),
-                        print_background=True,
-                        format="A4",
-                        margin={
-                            "top": "12mm",
-                            "bottom": "12mm",
-                            "left": "12mm",
-                            "right": "12mm",
-                        },
-                    )
-                    await context.close()
-                    results.append((u, pdf_path))
-                    print(f"[ok] {u} -> {pdf_path.name}")
+                    page = await contexts[i].new_page()
+                    try:
+                        await page.goto(u, wait_until=wait)
+                        if wait == "domcontentloaded":
+                            # Give subresources a short grace period; with
+                            # blocking enabled there is rarely anything left.
+                            try:
+                                await page.wait_for_load_state("load", timeout=5000)
+                            except PlaywrightTimeoutError:
+                                pass
+                        await page.emulate_media(media="print")
+                        safe = _SAFE_RE.sub(
+                            "_", urllib.parse.urlparse(u).path.strip("/") or "index"
+                        )[:100]
+                        pdf_path_str = f"{out_str}/{safe}.pdf"
+                        await page.pdf(
+                            path=pdf_path_str,
+                            print_background=True,
+                            format="A4",
+                            margin={
+                                "top": "12mm",
+                                "bottom": "12mm",
+                                "left": "12mm",
+                                "right": "12mm",
+                            },
+                        )
+                    finally:
+                        await page.close()
+                    results.append((u, Path(pdf_path_str)))
+                    print(f"[ok] {u} -> {safe}.pdf")
                 except (asyncio.TimeoutError, RuntimeError, ValueError) as e:
                     print(f"[warn] pdf fail {u}: {e}", file=sys.stderr)
+                finally:
+                    active_tabs[i] -= 1
 
         await asyncio.gather(*(worker(u) for u in urls))
-        await browser.close()
+        for context in contexts:
+            await context.close()
+        for browser in pool:
+            await browser.close()
 
     path_map = {u: p for (u, p) in results}
     return [(u, path_map[u]) for u in urls if u in path_map]
 
 
-def merge_pdfs(pairs: List[Tuple[str, Path]], out_pdf: Path):
-    """Merge individual PDFs into a single file with bookmarks.
+def _render_chunk(job: Tuple) -> List[Tuple[str, Path]]:
+    """Render one shard of URLs in a worker process (picklable entry point)."""
+    urls, out_dir, concurrency, timeout, keep_images, wait, browsers = job
+    return asyncio.run(
+        render_to_pdf(
+            urls,
+            Path(out_dir),
+            concurrency=concurrency,
+            timeout=timeout,
+            keep_images=keep_images,
+            wait=wait,
+            browsers=browsers,
+        )
+    )
+
+
+def render_in_processes(
+    urls: List[str],
+    out_dir: Path,
+    procs: int,
+    concurrency: int = 4,
+    timeout: int = 45,
+    keep_images: bool = False,
+    wait: str = "domcontentloaded",
+    browsers: int = 0,
+) -> List[Tuple[str, Path]]:
+    """Shard URL rendering across worker processes on many-core hosts.
+
+    Each process runs its own event loop, browser pool, and Playwright
+    driver, sidestepping the GIL + single-driver ceiling of one process.
+    Shards write to per-chunk subdirectories of ``out_dir``.
 
     Args:
-        pairs: List of (url, pdf_path) pairs.
-        out_pdf: Output merged PDF file.
+        urls: List of URLs to render.
+        out_dir: Directory to store individual PDFs (one subdir per shard).
+        procs: Number of worker processes.
+        concurrency: Max parallel rendering tasks per process.
+        timeout: Page load timeout (seconds).
+        keep_images: Load images too (e.g. for docs with screenshots).
+        wait: page.goto wait condition.
+        browsers: Chromium instances to pool per process (0 = auto).
+
+    Returns:
+        List of (url, pdf_path) pairs in the original URL order.
     """
+    chunks = [urls[i::procs] for i in range(procs)]
+    jobs = [
+        (
+            chunk,
+            str(out_dir / f"chunk_{i}"),
+            concurrency,
+            timeout,
+            keep_images,
+            wait,
+            browsers,
+        )
+        for i, chunk in enumerate(chunks)
+        if chunk
+    ]
+    with ProcessPoolExecutor(max_workers=len(jobs)) as ex:
+        results = list(ex.map(_render_chunk, jobs))
+
+    # Striped shards scramble completion order; re-key on URL to restore it.
+    path_map = {u: p for pairs in results for (u, p) in pairs}
+    return [(u, path_map[u]) for u in urls if u in path_map]
+
+
+def _merge_with_pikepdf(pairs: List[Tuple[str, Path]], tmp: Path):
+    """Merge via pikepdf (qpdf): C++-speed stream handling, low memory."""
+    out = pikepdf.Pdf.new()
+    sources = []
+    offsets: List[Tuple[str, int]] = []
+    try:
+        for url, path in pairs:
+            try:
+                src = pikepdf.open(str(path))
+            except (OSError, pikepdf.PdfError) as e:
+                print(f"[warn] merge fail {path}: {e}", file=sys.stderr)
+                continue
+            # Sources must stay open until save(): pages are copied lazily.
+            sources.append(src)
+            offsets.append((url, len(out.pages)))
+            out.pages.extend(src.pages)
+        with out.open_outline() as outline:
+            for url, offset in offsets:
+                outline.root.append(pikepdf.OutlineItem(url, offset))
+        # Save to an open handle and fsync so both merge paths give the
+        # same durability guarantee before the atomic rename.
+        with open(tmp, "wb") as f:
+            out.save(f, linearize=True)
+            f.flush()
+            os.fsync(f.fileno())
+    finally:
+        for src in sources:
+            src.close()
+        out.close()
+
+
+def _merge_with_pypdf(pairs: List[Tuple[str, Path]], tmp: Path):
+    """Merge via pypdf: pure-Python fallback when pikepdf is unavailable."""
     writer = PdfWriter()
-    page_offset = 0
-    for url, path in pairs:
+
+    def parse(path: Path):
+        try:
+            return PdfReader(str(path))
+        except (OSError, ValueError) as e:
+            print(f"[warn] merge fail {path}: {e}", file=sys.stderr)
+            return None
+
+    # Parse sources in parallel (pypdf releases the GIL in zlib), then
+    # append in order — PdfWriter itself is not thread-safe.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        readers = list(ex.map(parse, (path for _, path in pairs)))
+
+    for (url, path), reader in zip(pairs, readers):
+        if reader is None:
+            continue
         try:
-            reader = PdfReader(str(path))
-            writer.add_outline_item(url, page_number=page_offset)
-            for page in reader.pages:
-                writer.add_page(page)
-            page_offset = len(writer.pages)
+            # append() handles the bookmark page-offset bookkeeping itself.
+            writer.append(reader, outline_item=url, import_outline=False)
         except (OSError, ValueError) as e:
             print(f"[warn] merge fail {path}: {e}", file=sys.stderr)
 
-    with open(out_pdf, "wb") as f:
+    # Large write buffer + flush/fsync bounds dirty-page buildup during
+    # pypdf's many small writes.
+    with open(tmp, "wb", buffering=1 << 20) as f:
         writer.write(f)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def merge_pdfs(pairs: List[Tuple[str, Path]], out_pdf: Path):
+    """Merge individual PDFs into a single file with bookmarks.
+
+    Uses pikepdf (qpdf's C++ backend) when installed — much faster and
+    lighter on memory for large merges — and falls back to pypdf.
+
+    Args:
+        pairs: List of (url, pdf_path) pairs.
+        out_pdf: Output merged PDF file.
+    """
+    # Serialize into a sibling temp file, then rename: the os.replace
+    # makes the final output atomic — readers never see a half-written PDF.
+    tmp = out_pdf.with_suffix(".pdf.part")
+    if pikepdf is not None:
+        _merge_with_pikepdf(pairs, tmp)
+    else:
+        _merge_with_pypdf(pairs, tmp)
+    os.replace(tmp, out_pdf)
 
 
 def parse_csv(s: str) -> List[str]:
@@ -322,10 +714,33 @@ def main():
         "--max-pages", type=int, default=500, help="Max pages to include (crawl mode)"
     )
     ap.add_argument("--concurrency", type=int, default=4, help="Parallel PDF renders")
+    ap.add_argument(
+        "--browsers",
+        type=int,
+        default=0,
+        help="Chromium instances to pool (0 = auto from CPU count)",
+    )
+    ap.add_argument(
+        "--procs",
+        type=int,
+        default=1,
+        help="Worker processes for rendering (many-core hosts; 1 = in-process)",
+    )
     ap.add_argument("--timeout", type=int, default=45, help="Per-page load timeout (s)")
     ap.add_argument(
         "--keep", action="store_true", help="Keep individual page PDFs in ./_build"
     )
+    ap.add_argument(
+        "--keep-images",
+        action="store_true",
+        help="Load images while rendering (blocked by default for speed)",
+    )
+    ap.add_argument(
+        "--wait",
+        choices=["domcontentloaded", "load", "networkidle"],
+        default="domcontentloaded",
+        help="Page-load wait condition (networkidle is slowest but safest)",
+    )
     args = ap.parse_args()
 
     includes = parse_csv(args.include)
@@ -333,24 +748,21 @@ def main():
 
     # Gather URLs
     if args.sitemap:
-        all_urls = retrieve_from_sitemap(args.sitemap)
-        # filter domain from sitemap root
-        if not all_urls:
-            print("[error] sitemap yielded no URLs", file=sys.stderr)
-            sys.exit(2)
         # Same-domain scoping based on sitemap's own domain
-        root = args.sitemap
-        root_domain = f"{urllib.parse.urlparse(root).scheme}://{urllib.parse.urlparse(root).netloc}"
-        filtered = []
-        for u in all_urls:
-            if not u.startswith(root_domain):
-                continue
-            u = normalize_url(u)
-            if match_filters(u, includes, excludes):
-                filtered.append(u)
-        urls = sorted(set(filtered))
+        root = urllib.parse.urlparse(args.sitemap)
+        root_domain = f"{root.scheme}://{root.netloc}"
+        inc_re, exc_re = compile_filters(includes, excludes)
+        # One streamed pass: normalize + filter into a set, sort once.
+        candidates = (
+            normalize_url(u)
+            for u in asyncio.run(retrieve_from_sitemap(args.sitemap))
+            if u.startswith(root_domain)
+        )
+        urls = sorted({u for u in candidates if match_filters(u, inc_re, exc_re)})
     else:
-        urls = crawl(args.start, includes, excludes, max_pages=args.max_pages)
+        urls = asyncio.run(
+            crawl_async(args.start, includes, excludes, max_pages=args.max_pages)
+        )
 
     if not urls:
         print("[error] No URLs after filtering.", file=sys.stderr)
@@ -360,11 +772,29 @@ def main():
 
     # Render
     build_dir = Path("./_build")
-    pairs = asyncio.run(
-        render_to_pdf(
-            urls, build_dir, concurrency=args.concurrency, timeout=args.timeout
+    if args.procs > 1:
+        pairs = render_in_processes(
+            urls,
+            build_dir,
+            args.procs,
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+            keep_images=args.keep_images,
+            wait=args.wait,
+            browsers=args.browsers,
+        )
+    else:
+        pairs = asyncio.run(
+            render_to_pdf(
+                urls,
+                build_dir,
+                concurrency=args.concurrency,
+                timeout=args.timeout,
+                keep_images=args.keep_images,
+                wait=args.wait,
+                browsers=args.browsers,
+            )
         )
-    )
 
     if not pairs:
         print("[error] No PDFs rendered successfully.", file=sys.stderr)
@@ -382,10 +812,13 @@ def main():
                 p.unlink()
             except OSError:
                 pass
-        try:
-            build_dir.rmdir()
-        except OSError:
-            pass
+        # Chunk subdirs (multi-process mode) sort after their parent, so
+        # reverse order removes them before build_dir itself.
+        for d in sorted({p.parent for _, p in pairs} | {build_dir}, reverse=True):
+            try:
+                d.rmdir()
+            except OSError:
+                pass
 
 
 if __name__ == "__main__":